@@ -0,0 +1,197 @@
+-- ClubhouseWidget Games Read Model
+-- Run this AFTER 001_initial_schema.sql
+--
+-- clubhouse_games_read keeps one row per game with the home and away team
+-- names and the game's meal already joined, so the games screens need a
+-- single indexed read instead of a lookup into clubhouse_teams and
+-- clubhouse_meals per request.
+--
+-- Statement-level triggers on clubhouse_games, clubhouse_teams and
+-- clubhouse_meals refresh only the games a statement touched, for API
+-- writes, COPY loads and syncs alike. migrate_supabase_to_aurora.py disables
+-- them for its bulk load, then applies this file (re-creating them enabled)
+-- and rebuilds the whole table once.
+
+-- ============================================================================
+-- READ MODEL TABLE
+-- ============================================================================
+CREATE TABLE IF NOT EXISTS clubhouse_games_read (
+    id BIGINT PRIMARY KEY, -- clubhouse_games.id
+    home_team_id BIGINT NOT NULL,
+    away_team_id BIGINT NOT NULL,
+    date DATE,
+    time TIME,
+    created_at TIMESTAMPTZ NOT NULL,
+    home_team_name TEXT,
+    away_team_name TEXT,
+    meal_id BIGINT,
+    pre_game_snack TEXT,
+    post_game_meal TEXT
+);
+
+CREATE INDEX IF NOT EXISTS idx_clubhouse_games_read_date_time
+    ON clubhouse_games_read(date, time);
+CREATE INDEX IF NOT EXISTS idx_clubhouse_games_read_home_team
+    ON clubhouse_games_read(home_team_id, date, time);
+CREATE INDEX IF NOT EXISTS idx_clubhouse_games_read_away_team
+    ON clubhouse_games_read(away_team_id, date, time);
+
+-- ============================================================================
+-- REFRESH
+-- ============================================================================
+-- Rebuilds the rows for game_ids, or the whole table when game_ids is NULL.
+-- Rows of games that no longer exist are removed.
+-- Returns the number of rows written.
+CREATE OR REPLACE FUNCTION clubhouse_refresh_games_read(game_ids BIGINT[])
+RETURNS INTEGER AS $$
+DECLARE
+    refreshed INTEGER;
+BEGIN
+    IF game_ids IS NULL THEN
+        TRUNCATE clubhouse_games_read;
+    ELSE
+        DELETE FROM clubhouse_games_read r
+        WHERE r.id = ANY(game_ids)
+          AND NOT EXISTS (SELECT 1 FROM clubhouse_games g WHERE g.id = r.id);
+    END IF;
+
+    INSERT INTO clubhouse_games_read (
+        id, home_team_id, away_team_id, date, time, created_at,
+        home_team_name, away_team_name, meal_id, pre_game_snack, post_game_meal
+    )
+    SELECT g.id, g.home_team_id, g.away_team_id, g.date, g.time, g.created_at,
+           ht.team_name, at.team_name, m.id, m.pre_game_snack, m.post_game_meal
+    FROM clubhouse_games g
+    LEFT JOIN clubhouse_teams ht ON g.home_team_id = ht.id
+    LEFT JOIN clubhouse_teams at ON g.away_team_id = at.id
+    -- The meals routes keep one meal per game; take the first if there are more
+    LEFT JOIN LATERAL (
+        SELECT id, pre_game_snack, post_game_meal
+        FROM clubhouse_meals
+        WHERE game_id = g.id
+        ORDER BY id
+        LIMIT 1
+    ) m ON TRUE
+    WHERE game_ids IS NULL OR g.id = ANY(game_ids)
+    -- Upsert rather than delete + insert, so concurrent refreshes of one game don't collide
+    ON CONFLICT (id) DO UPDATE SET
+        home_team_id = EXCLUDED.home_team_id,
+        away_team_id = EXCLUDED.away_team_id,
+        date = EXCLUDED.date,
+        time = EXCLUDED.time,
+        created_at = EXCLUDED.created_at,
+        home_team_name = EXCLUDED.home_team_name,
+        away_team_name = EXCLUDED.away_team_name,
+        meal_id = EXCLUDED.meal_id,
+        pre_game_snack = EXCLUDED.pre_game_snack,
+        post_game_meal = EXCLUDED.post_game_meal;
+
+    GET DIAGNOSTICS refreshed = ROW_COUNT;
+    RETURN refreshed;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================================================
+-- INCREMENTAL MAINTENANCE
+-- ============================================================================
+-- Transition tables are only available to single-event triggers, so each
+-- table gets one trigger per event sharing a function that branches on TG_OP.
+
+CREATE OR REPLACE FUNCTION clubhouse_games_read_sync_games()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed BIGINT[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        changed := changed || ARRAY(SELECT id FROM new_rows);
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        changed := changed || ARRAY(SELECT id FROM old_rows);
+    END IF;
+
+    PERFORM clubhouse_refresh_games_read(changed);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION clubhouse_games_read_sync_meals()
+RETURNS TRIGGER AS $$
+DECLARE
+    changed BIGINT[] := '{}';
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        changed := changed || ARRAY(SELECT game_id FROM new_rows);
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        changed := changed || ARRAY(SELECT game_id FROM old_rows);
+    END IF;
+
+    PERFORM clubhouse_refresh_games_read(changed);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Deleting a team cascades to its games, so only renames need handling here
+CREATE OR REPLACE FUNCTION clubhouse_games_read_sync_teams()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM clubhouse_refresh_games_read(ARRAY(
+        SELECT g.id
+        FROM clubhouse_games g
+        JOIN new_rows t ON t.id IN (g.home_team_id, g.away_team_id)
+    ));
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION clubhouse_games_read_truncate()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM clubhouse_refresh_games_read(NULL);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clubhouse_games_read_insert ON clubhouse_games;
+CREATE TRIGGER clubhouse_games_read_insert
+    AFTER INSERT ON clubhouse_games REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_games();
+DROP TRIGGER IF EXISTS clubhouse_games_read_update ON clubhouse_games;
+CREATE TRIGGER clubhouse_games_read_update
+    AFTER UPDATE ON clubhouse_games REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_games();
+DROP TRIGGER IF EXISTS clubhouse_games_read_delete ON clubhouse_games;
+CREATE TRIGGER clubhouse_games_read_delete
+    AFTER DELETE ON clubhouse_games REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_games();
+DROP TRIGGER IF EXISTS clubhouse_games_read_truncate ON clubhouse_games;
+CREATE TRIGGER clubhouse_games_read_truncate
+    AFTER TRUNCATE ON clubhouse_games
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_truncate();
+
+DROP TRIGGER IF EXISTS clubhouse_games_read_insert ON clubhouse_meals;
+CREATE TRIGGER clubhouse_games_read_insert
+    AFTER INSERT ON clubhouse_meals REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_meals();
+DROP TRIGGER IF EXISTS clubhouse_games_read_update ON clubhouse_meals;
+CREATE TRIGGER clubhouse_games_read_update
+    AFTER UPDATE ON clubhouse_meals REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_meals();
+DROP TRIGGER IF EXISTS clubhouse_games_read_delete ON clubhouse_meals;
+CREATE TRIGGER clubhouse_games_read_delete
+    AFTER DELETE ON clubhouse_meals REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_meals();
+DROP TRIGGER IF EXISTS clubhouse_games_read_truncate ON clubhouse_meals;
+CREATE TRIGGER clubhouse_games_read_truncate
+    AFTER TRUNCATE ON clubhouse_meals
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_truncate();
+
+DROP TRIGGER IF EXISTS clubhouse_games_read_update ON clubhouse_teams;
+CREATE TRIGGER clubhouse_games_read_update
+    AFTER UPDATE ON clubhouse_teams REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT EXECUTE FUNCTION clubhouse_games_read_sync_teams();
+
+-- ============================================================================
+-- COMMENTS
+-- ============================================================================
+COMMENT ON TABLE clubhouse_games_read IS 'Games with team names and meal, maintained by triggers';
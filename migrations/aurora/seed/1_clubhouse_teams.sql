@@ -0,0 +1,21 @@
+-- clubhouse_teams: 10 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_teams (id, team_name, created_at) FROM stdin;
+1	Lancaster Stormers	2025-11-29T19:26:30.287131+00:00
+2	Long Island Ducks	2025-11-29T19:26:30.287131+00:00
+3	York Revolution	2025-11-29T19:26:30.287131+00:00
+4	Staten Island Ferry Hawks	2025-11-29T19:26:30.287131+00:00
+5	Hagerstown Flying Boxcars	2025-11-29T19:26:30.287131+00:00
+6	Gastonia Flying Boxcars	2025-11-29T19:26:30.287131+00:00
+7	High Point Rockers	2025-11-29T19:26:30.287131+00:00
+8	Lexington Legends	2025-11-29T19:26:30.287131+00:00
+9	Southern Maryland Blue Crabs	2025-11-29T19:26:30.287131+00:00
+10	Charleston Dirty Birds	2025-11-29T19:26:30.287131+00:00
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_teams', 'id'), (SELECT MAX(id) FROM clubhouse_teams));
+
+COMMIT;
@@ -0,0 +1,1011 @@
+-- clubhouse_games: 1000 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_games (id, home_team_id, away_team_id, date, time, created_at) FROM stdin;
+1	10	8	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+2	10	8	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+3	10	8	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+4	10	8	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+5	10	8	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+6	5	10	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+7	5	10	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+8	5	10	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+9	5	10	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+10	5	10	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+11	5	10	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+12	10	4	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+13	10	4	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+14	10	4	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+15	10	4	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+16	10	4	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+17	10	4	2026-05-10	\N	2025-11-29T19:48:24.139021+00:00
+18	8	10	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+19	8	10	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+20	8	10	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+21	8	10	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+22	8	10	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+23	8	10	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+24	6	10	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+25	6	10	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+26	6	10	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+27	6	10	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+28	6	10	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+29	6	10	2026-05-24	\N	2025-11-29T19:48:24.139021+00:00
+30	10	6	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+31	10	6	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+32	10	6	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+33	10	6	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+34	10	6	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+35	10	6	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+36	10	3	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+37	10	3	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+38	10	3	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+39	10	3	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+40	10	3	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+41	10	5	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+42	10	5	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+43	10	5	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+44	10	5	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+45	10	5	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+46	5	10	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+47	5	10	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+48	5	10	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+49	5	10	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+50	5	10	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+51	3	10	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+52	3	10	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+53	3	10	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+54	3	10	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+55	3	10	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+56	10	7	2026-06-29	\N	2025-11-29T19:48:24.139021+00:00
+57	10	7	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+58	10	7	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+59	10	7	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+60	10	7	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+61	10	7	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+62	2	10	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+63	2	10	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+64	2	10	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+65	2	10	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+66	2	10	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+67	10	6	2026-07-14	\N	2025-11-29T19:48:24.139021+00:00
+68	10	6	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+69	10	6	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+70	10	6	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+71	10	6	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+72	10	6	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+73	7	10	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+74	7	10	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+75	7	10	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+76	7	10	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+77	7	10	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+78	7	10	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+79	6	10	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+80	6	10	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+81	6	10	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+82	6	10	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+83	7	10	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+84	7	10	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+85	7	10	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+86	10	8	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+87	10	8	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+88	10	8	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+89	10	8	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+90	10	8	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+91	10	8	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+92	10	8	2026-08-10	\N	2025-11-29T19:48:24.139021+00:00
+93	10	5	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+94	10	5	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+95	10	5	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+96	10	5	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+97	10	5	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+98	10	5	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+99	10	5	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+100	6	10	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+101	6	10	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+102	6	10	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+103	6	10	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+104	6	10	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+105	6	10	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+106	6	10	2026-08-24	\N	2025-11-29T19:48:24.139021+00:00
+107	1	10	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+108	1	10	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+109	1	10	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+110	1	10	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+111	1	10	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+112	10	8	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+113	10	8	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+114	10	8	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+115	7	10	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+116	7	10	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+117	7	10	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+118	8	10	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+119	8	10	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+120	8	10	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+121	8	10	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+122	7	6	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+123	7	6	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+124	7	6	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+125	6	7	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+126	6	7	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+127	6	7	2026-04-26	\N	2025-11-29T19:48:24.139021+00:00
+128	3	6	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+129	3	6	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+130	3	6	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+131	3	6	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+132	3	6	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+133	3	6	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+134	6	9	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+135	6	9	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+136	6	9	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+137	6	9	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+138	6	9	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+139	6	9	2026-05-10	\N	2025-11-29T19:48:24.139021+00:00
+140	2	6	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+141	2	6	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+142	2	6	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+143	2	6	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+144	2	6	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+145	2	6	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+146	6	10	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+147	6	10	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+148	6	10	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+149	6	10	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+150	6	10	2026-05-24	\N	2025-11-29T19:48:24.139021+00:00
+151	8	6	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+152	8	6	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+153	8	6	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+154	6	10	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+155	6	10	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+156	6	10	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+157	6	1	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+158	6	1	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+159	6	1	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+160	6	1	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+161	6	1	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+162	6	1	2026-06-07	\N	2025-11-29T19:48:24.139021+00:00
+163	8	6	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+164	8	6	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+165	8	6	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+166	8	6	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+167	8	6	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+168	8	6	2026-06-14	\N	2025-11-29T19:48:24.139021+00:00
+169	4	6	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+170	4	6	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+171	4	6	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+172	4	6	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+173	4	6	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+174	4	6	2026-06-21	\N	2025-11-29T19:48:24.139021+00:00
+175	1	6	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+176	1	6	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+177	1	6	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+178	1	6	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+179	1	6	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+180	1	6	2026-06-28	\N	2025-11-29T19:48:24.139021+00:00
+181	6	8	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+182	6	8	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+183	6	8	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+184	6	10	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+185	6	10	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+186	6	10	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+187	5	6	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+188	5	6	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+189	5	6	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+190	5	6	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+191	5	6	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+192	5	6	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+193	6	8	2026-07-14	\N	2025-11-29T19:48:24.139021+00:00
+194	6	8	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+195	6	8	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+196	6	8	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+197	6	8	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+198	6	8	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+199	10	6	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+200	10	6	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+201	10	6	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+202	10	6	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+203	10	6	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+204	10	6	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+205	6	5	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+206	6	5	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+207	6	5	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+208	6	5	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+209	6	5	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+210	6	5	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+211	6	9	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+212	6	9	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+213	6	9	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+214	8	6	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+215	8	6	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+216	8	6	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+217	10	6	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+218	10	6	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+219	10	6	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+220	10	6	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+221	10	6	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+222	10	6	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+223	6	10	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+224	6	10	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+225	6	10	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+226	6	10	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+227	6	10	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+228	6	10	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+229	9	6	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+230	9	6	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+231	9	6	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+232	9	6	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+233	9	6	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+234	9	6	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+235	6	7	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+236	6	7	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+237	6	7	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+238	6	7	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+239	6	7	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+240	6	7	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+241	6	8	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+242	6	8	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+243	6	8	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+244	7	6	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+245	7	6	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+246	7	6	2026-09-13	\N	2025-11-29T19:48:24.139021+00:00
+247	3	1	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+248	3	1	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+249	3	1	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+250	3	5	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+251	3	5	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+252	3	6	2026-04-27	\N	2025-11-29T19:48:24.139021+00:00
+253	3	6	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+254	3	6	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+255	3	6	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+256	3	6	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+257	3	6	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+258	7	3	2026-05-04	\N	2025-11-29T19:48:24.139021+00:00
+259	7	3	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+260	7	3	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+261	3	4	2026-05-11	\N	2025-11-29T19:48:24.139021+00:00
+262	3	4	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+263	3	4	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+264	3	4	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+265	3	4	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+266	3	4	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+267	3	5	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+268	3	5	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+269	3	5	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+270	3	5	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+271	3	5	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+272	3	5	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+273	3	2	2026-05-25	\N	2025-11-29T19:48:24.139021+00:00
+274	3	2	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+275	3	2	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+276	3	2	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+277	3	2	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+278	3	2	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+279	5	3	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+280	3	10	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+281	3	10	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+282	3	10	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+283	3	10	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+284	3	10	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+285	1	3	2026-06-07	\N	2025-11-29T19:48:24.139021+00:00
+286	1	3	2026-06-08	\N	2025-11-29T19:48:24.139021+00:00
+287	1	3	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+288	1	3	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+289	1	3	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+290	1	3	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+291	1	3	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+292	3	9	2026-06-14	\N	2025-11-29T19:48:24.139021+00:00
+293	3	9	2026-06-15	\N	2025-11-29T19:48:24.139021+00:00
+294	3	9	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+295	3	9	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+296	3	9	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+297	3	9	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+298	3	9	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+299	3	10	2026-06-22	\N	2025-11-29T19:48:24.139021+00:00
+300	3	10	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+301	3	10	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+302	3	10	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+303	3	10	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+304	3	10	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+305	4	3	2026-06-29	\N	2025-11-29T19:48:24.139021+00:00
+306	4	3	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+307	1	3	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+308	1	3	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+309	1	3	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+310	1	3	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+311	3	8	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+312	3	8	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+313	3	8	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+314	3	8	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+315	3	8	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+316	3	8	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+317	3	8	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+318	4	3	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+319	4	3	2026-07-13	\N	2025-11-29T19:48:24.139021+00:00
+320	4	3	2026-07-14	\N	2025-11-29T19:48:24.139021+00:00
+321	4	3	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+322	4	3	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+323	4	3	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+324	3	1	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+325	3	1	2026-07-20	\N	2025-11-29T19:48:24.139021+00:00
+326	3	1	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+327	3	1	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+328	3	1	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+329	3	1	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+330	8	3	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+331	8	3	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+332	8	3	2026-07-27	\N	2025-11-29T19:48:24.139021+00:00
+333	8	3	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+334	8	3	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+335	8	3	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+336	8	3	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+337	3	8	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+338	3	8	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+339	3	8	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+340	3	8	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+341	3	8	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+342	3	2	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+343	3	2	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+344	3	2	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+345	3	2	2026-08-10	\N	2025-11-29T19:48:24.139021+00:00
+346	3	2	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+347	5	3	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+348	5	3	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+349	5	3	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+350	7	3	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+351	7	3	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+352	7	3	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+353	7	3	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+354	7	3	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+355	7	3	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+356	3	4	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+357	3	4	2026-08-24	\N	2025-11-29T19:48:24.139021+00:00
+358	3	4	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+359	3	4	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+360	3	4	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+361	9	3	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+362	9	3	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+363	9	3	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+364	9	3	2026-08-31	\N	2025-11-29T19:48:24.139021+00:00
+365	3	2	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+366	3	2	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+367	3	2	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+368	3	2	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+369	3	2	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+370	4	3	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+371	4	3	2026-09-07	\N	2025-11-29T19:48:24.139021+00:00
+372	4	3	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+373	4	3	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+374	4	3	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+375	4	3	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+376	4	3	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+377	5	2	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+378	5	2	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+379	5	2	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+380	5	3	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+381	5	3	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+382	5	3	2026-04-26	\N	2025-11-29T19:48:24.139021+00:00
+383	5	10	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+384	5	10	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+385	5	10	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+386	5	10	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+387	5	2	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+388	5	2	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+389	5	2	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+390	9	5	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+391	9	5	2026-05-10	\N	2025-11-29T19:48:24.139021+00:00
+392	9	5	2026-05-11	\N	2025-11-29T19:48:24.139021+00:00
+393	9	5	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+394	9	5	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+395	9	5	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+396	3	5	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+397	3	5	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+398	3	5	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+399	3	5	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+400	3	5	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+401	3	5	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+402	4	5	2026-05-24	\N	2025-11-29T19:48:24.139021+00:00
+403	4	5	2026-05-25	\N	2025-11-29T19:48:24.139021+00:00
+404	4	5	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+405	4	5	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+406	4	5	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+407	5	3	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+408	5	3	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+409	5	8	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+410	5	8	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+411	5	8	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+412	5	8	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+413	5	8	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+414	5	8	2026-06-07	\N	2025-11-29T19:48:24.139021+00:00
+415	5	4	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+416	5	4	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+417	5	4	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+418	5	4	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+419	5	4	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+420	5	4	2026-06-14	\N	2025-11-29T19:48:24.139021+00:00
+421	5	10	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+422	5	10	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+423	5	10	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+424	5	10	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+425	5	10	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+426	5	10	2026-06-21	\N	2025-11-29T19:48:24.139021+00:00
+427	5	8	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+428	5	8	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+429	5	8	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+430	5	8	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+431	5	8	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+432	5	1	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+433	2	5	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+434	2	5	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+435	2	5	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+436	2	5	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+437	2	5	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+438	6	5	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+439	6	5	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+440	6	5	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+441	6	5	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+442	6	5	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+443	6	5	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+444	7	5	2026-07-14	\N	2025-11-29T19:48:24.139021+00:00
+445	7	5	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+446	7	5	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+447	7	5	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+448	7	5	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+449	7	5	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+450	5	2	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+451	5	2	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+452	5	2	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+453	5	2	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+454	5	2	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+455	5	2	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+456	5	6	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+457	5	6	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+458	5	6	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+459	5	6	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+460	5	6	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+461	5	7	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+462	5	7	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+463	5	7	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+464	5	3	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+465	5	3	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+466	5	3	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+467	5	10	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+468	5	10	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+469	5	10	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+470	5	9	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+471	5	9	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+472	5	9	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+473	5	2	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+474	5	2	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+475	5	2	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+476	5	2	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+477	5	2	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+478	5	2	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+479	5	9	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+480	5	9	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+481	5	9	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+482	5	9	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+483	5	9	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+484	5	9	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+485	4	5	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+486	4	5	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+487	2	5	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+488	2	5	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+489	2	5	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+490	5	1	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+491	5	1	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+492	5	1	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+493	5	1	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+494	5	1	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+495	5	1	2026-09-13	\N	2025-11-29T19:48:24.139021+00:00
+496	6	7	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+497	6	7	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+498	6	7	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+499	6	7	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+500	6	7	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+501	9	7	2026-04-27	\N	2025-11-29T19:48:24.139021+00:00
+502	9	7	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+503	9	7	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+504	9	7	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+505	9	7	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+506	9	7	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+507	7	3	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+508	7	3	2026-05-04	\N	2025-11-29T19:48:24.139021+00:00
+509	7	3	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+510	7	3	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+511	7	3	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+512	7	3	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+513	7	3	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+514	1	7	2026-05-11	\N	2025-11-29T19:48:24.139021+00:00
+515	1	7	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+516	1	7	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+517	1	7	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+518	1	7	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+519	1	7	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+520	2	7	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+521	2	7	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+522	2	7	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+523	2	7	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+524	2	7	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+525	2	7	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+526	2	7	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+527	10	7	2026-05-24	\N	2025-11-29T19:48:24.139021+00:00
+528	10	7	2026-05-25	\N	2025-11-29T19:48:24.139021+00:00
+529	10	7	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+530	10	7	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+531	10	7	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+532	10	7	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+533	10	7	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+534	10	7	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+535	7	9	2026-06-01	\N	2025-11-29T19:48:24.139021+00:00
+536	7	9	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+537	7	9	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+538	7	9	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+539	7	9	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+540	7	9	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+541	7	10	2026-06-08	\N	2025-11-29T19:48:24.139021+00:00
+542	7	10	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+543	7	10	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+544	7	10	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+545	7	10	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+546	7	10	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+547	7	8	2026-06-15	\N	2025-11-29T19:48:24.139021+00:00
+548	7	8	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+549	7	8	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+550	7	8	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+551	7	8	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+552	7	8	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+553	9	7	2026-06-22	\N	2025-11-29T19:48:24.139021+00:00
+554	9	7	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+555	9	7	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+556	9	7	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+557	9	7	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+558	9	7	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+559	7	10	2026-06-29	\N	2025-11-29T19:48:24.139021+00:00
+560	7	10	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+561	7	10	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+562	7	10	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+563	7	10	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+564	7	10	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+565	7	8	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+566	7	8	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+567	7	8	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+568	7	8	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+569	7	8	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+570	7	8	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+571	7	8	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+572	7	5	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+573	7	5	2026-07-13	\N	2025-11-29T19:48:24.139021+00:00
+574	7	5	2026-07-14	\N	2025-11-29T19:48:24.139021+00:00
+575	7	5	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+576	7	5	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+577	7	5	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+578	7	5	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+579	8	7	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+580	8	7	2026-07-20	\N	2025-11-29T19:48:24.139021+00:00
+581	8	7	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+582	8	7	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+583	8	7	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+584	8	7	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+585	8	7	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+586	7	10	2026-07-27	\N	2025-11-29T19:48:24.139021+00:00
+587	7	10	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+588	7	10	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+589	7	10	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+590	7	10	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+591	7	10	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+592	5	7	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+593	5	7	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+594	5	7	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+595	5	7	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+596	5	7	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+597	5	7	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+598	5	7	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+599	1	7	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+600	1	7	2026-08-10	\N	2025-11-29T19:48:24.139021+00:00
+601	1	7	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+602	1	7	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+603	1	7	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+604	1	7	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+605	7	6	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+606	7	6	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+607	7	6	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+608	7	6	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+609	7	3	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+610	7	3	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+611	7	3	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+612	7	3	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+613	7	3	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+614	7	3	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+615	7	3	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+616	7	8	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+617	7	8	2026-08-24	\N	2025-11-29T19:48:24.139021+00:00
+618	7	8	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+619	7	8	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+620	7	8	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+621	7	8	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+622	8	7	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+623	8	7	2026-08-31	\N	2025-11-29T19:48:24.139021+00:00
+624	7	6	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+625	7	6	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+626	7	6	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+627	7	6	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+628	7	6	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+629	7	6	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+630	6	7	2026-09-07	\N	2025-11-29T19:48:24.139021+00:00
+631	6	7	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+632	6	7	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+633	6	7	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+634	6	7	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+635	6	7	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+636	1	2	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+637	1	2	2026-04-26	\N	2025-11-29T19:48:24.139021+00:00
+638	1	2	2026-04-27	\N	2025-11-29T19:48:24.139021+00:00
+639	1	2	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+640	1	8	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+641	1	8	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+642	1	8	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+643	1	8	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+644	1	8	2026-05-04	\N	2025-11-29T19:48:24.139021+00:00
+645	1	7	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+646	1	7	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+647	1	7	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+648	1	7	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+649	1	5	2026-05-10	\N	2025-11-29T19:48:24.139021+00:00
+650	1	5	2026-05-11	\N	2025-11-29T19:48:24.139021+00:00
+651	1	5	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+652	1	5	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+653	1	5	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+654	1	3	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+655	1	3	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+656	1	3	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+657	1	3	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+658	1	9	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+659	1	9	2026-05-24	\N	2025-11-29T19:48:24.139021+00:00
+660	1	9	2026-05-25	\N	2025-11-29T19:48:24.139021+00:00
+661	1	9	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+662	2	1	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+663	2	1	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+664	2	1	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+665	2	1	2026-05-31	\N	2025-11-29T19:48:24.139021+00:00
+666	1	3	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+667	1	3	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+668	1	3	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+669	1	3	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+670	1	3	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+671	1	3	2026-06-07	\N	2025-11-29T19:48:24.139021+00:00
+672	1	5	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+673	1	5	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+674	1	5	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+675	1	5	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+676	1	5	2026-06-14	\N	2025-11-29T19:48:24.139021+00:00
+677	1	7	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+678	1	7	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+679	1	7	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+680	1	7	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+681	1	7	2026-06-21	\N	2025-11-29T19:48:24.139021+00:00
+682	1	9	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+683	1	9	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+684	1	9	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+685	1	9	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+686	1	9	2026-06-28	\N	2025-11-29T19:48:24.139021+00:00
+687	1	9	2026-06-29	\N	2025-11-29T19:48:24.139021+00:00
+688	1	4	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+689	1	4	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+690	1	4	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+691	1	4	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+692	1	4	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+693	1	7	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+694	1	7	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+695	1	7	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+696	1	7	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+697	1	7	2026-07-13	\N	2025-11-29T19:48:24.139021+00:00
+698	2	1	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+699	2	1	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+700	2	1	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+701	2	1	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+702	2	1	2026-07-20	\N	2025-11-29T19:48:24.139021+00:00
+703	1	3	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+704	1	3	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+705	1	3	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+706	1	3	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+707	1	3	2026-07-27	\N	2025-11-29T19:48:24.139021+00:00
+708	1	4	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+709	1	4	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+710	1	4	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+711	1	4	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+712	1	4	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+713	1	9	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+714	1	9	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+715	1	9	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+716	1	9	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+717	1	9	2026-08-10	\N	2025-11-29T19:48:24.139021+00:00
+718	1	6	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+719	1	6	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+720	1	6	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+721	1	6	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+722	1	6	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+723	1	3	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+724	1	3	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+725	1	3	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+726	1	3	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+727	1	3	2026-08-24	\N	2025-11-29T19:48:24.139021+00:00
+728	1	2	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+729	1	2	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+730	1	2	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+731	1	2	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+732	1	2	2026-08-31	\N	2025-11-29T19:48:24.139021+00:00
+733	1	5	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+734	1	5	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+735	1	5	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+736	1	5	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+737	1	5	2026-09-07	\N	2025-11-29T19:48:24.139021+00:00
+738	1	9	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+739	1	9	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+740	1	9	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+741	1	9	2026-09-13	\N	2025-11-29T19:48:24.139021+00:00
+742	1	9	2026-09-14	\N	2025-11-29T19:48:24.139021+00:00
+743	1	7	2026-09-17	\N	2025-11-29T19:48:24.139021+00:00
+744	1	7	2026-09-18	\N	2025-11-29T19:48:24.139021+00:00
+745	1	7	2026-09-19	\N	2025-11-29T19:48:24.139021+00:00
+746	1	7	2026-09-20	\N	2025-11-29T19:48:24.139021+00:00
+747	1	7	2026-09-21	\N	2025-11-29T19:48:24.139021+00:00
+748	1	2	2026-09-24	\N	2025-11-29T19:48:24.139021+00:00
+749	1	2	2026-09-25	\N	2025-11-29T19:48:24.139021+00:00
+750	1	2	2026-09-26	\N	2025-11-29T19:48:24.139021+00:00
+751	1	2	2026-09-27	\N	2025-11-29T19:48:24.139021+00:00
+752	1	2	2026-09-28	\N	2025-11-29T19:48:24.139021+00:00
+753	8	5	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+754	8	5	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+755	8	5	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+756	8	9	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+757	8	9	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+758	8	9	2026-04-26	\N	2025-11-29T19:48:24.139021+00:00
+759	1	8	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+760	1	8	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+761	1	8	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+762	2	8	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+763	2	8	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+764	2	8	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+765	8	3	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+766	8	3	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+767	8	3	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+768	8	6	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+769	8	6	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+770	8	6	2026-05-10	\N	2025-11-29T19:48:24.139021+00:00
+771	8	5	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+772	8	5	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+773	8	5	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+774	10	8	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+775	10	8	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+776	10	8	2026-05-17	\N	2025-11-29T19:48:24.139021+00:00
+777	10	8	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+778	7	8	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+779	7	8	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+780	7	8	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+781	7	8	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+782	8	5	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+783	8	5	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+784	8	5	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+785	8	5	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+786	5	8	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+787	5	8	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+788	5	8	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+789	6	8	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+790	6	8	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+791	6	8	2026-06-07	\N	2025-11-29T19:48:24.139021+00:00
+792	6	8	2026-06-08	\N	2025-11-29T19:48:24.139021+00:00
+793	8	7	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+794	8	7	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+795	8	7	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+796	8	7	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+797	8	10	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+798	8	10	2026-06-14	\N	2025-11-29T19:48:24.139021+00:00
+799	8	10	2026-06-15	\N	2025-11-29T19:48:24.139021+00:00
+800	8	10	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+801	7	8	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+802	7	8	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+803	7	8	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+804	7	8	2026-06-21	\N	2025-11-29T19:48:24.139021+00:00
+805	8	6	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+806	8	6	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+807	8	6	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+808	8	9	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+809	8	9	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+810	8	9	2026-06-28	\N	2025-11-29T19:48:24.139021+00:00
+811	8	5	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+812	8	5	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+813	8	5	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+814	6	8	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+815	6	8	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+816	6	8	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+817	6	8	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+818	9	8	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+819	9	8	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+820	9	8	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+821	8	5	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+822	8	5	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+823	8	5	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+824	8	5	2026-07-13	\N	2025-11-29T19:48:24.139021+00:00
+825	8	10	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+826	8	10	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+827	8	10	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+828	8	10	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+829	5	8	2026-07-20	\N	2025-11-29T19:48:24.139021+00:00
+830	5	8	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+831	5	8	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+832	5	8	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+833	8	3	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+834	8	3	2026-07-25	\N	2025-11-29T19:48:24.139021+00:00
+835	8	3	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+836	8	3	2026-07-27	\N	2025-11-29T19:48:24.139021+00:00
+837	8	9	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+838	8	9	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+839	8	9	2026-07-31	\N	2025-11-29T19:48:24.139021+00:00
+840	8	9	2026-08-01	\N	2025-11-29T19:48:24.139021+00:00
+841	8	9	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+842	8	9	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+843	3	8	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+844	3	8	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+845	3	8	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+846	8	2	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+847	8	2	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+848	8	2	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+849	8	2	2026-08-10	\N	2025-11-29T19:48:24.139021+00:00
+850	9	8	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+851	9	8	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+852	9	8	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+853	9	8	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+854	8	3	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+855	8	3	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+856	8	3	2026-08-17	\N	2025-11-29T19:48:24.139021+00:00
+857	8	10	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+858	8	10	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+859	8	10	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+860	8	10	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+861	8	10	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+862	8	10	2026-08-24	\N	2025-11-29T19:48:24.139021+00:00
+863	7	8	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+864	7	8	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+865	7	8	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+866	7	8	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+867	8	5	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+868	8	5	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+869	8	5	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+870	8	5	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+871	8	5	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+872	8	5	2026-09-06	\N	2025-11-29T19:48:24.139021+00:00
+873	8	3	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+874	8	3	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+875	8	3	2026-09-10	\N	2025-11-29T19:48:24.139021+00:00
+876	8	3	2026-09-11	\N	2025-11-29T19:48:24.139021+00:00
+877	8	3	2026-09-12	\N	2025-11-29T19:48:24.139021+00:00
+878	8	3	2026-09-13	\N	2025-11-29T19:48:24.139021+00:00
+879	9	4	2026-04-21	\N	2025-11-29T19:48:24.139021+00:00
+880	9	4	2026-04-22	\N	2025-11-29T19:48:24.139021+00:00
+881	9	4	2026-04-23	\N	2025-11-29T19:48:24.139021+00:00
+882	4	9	2026-04-24	\N	2025-11-29T19:48:24.139021+00:00
+883	4	9	2026-04-25	\N	2025-11-29T19:48:24.139021+00:00
+884	4	9	2026-04-26	\N	2025-11-29T19:48:24.139021+00:00
+885	9	7	2026-04-28	\N	2025-11-29T19:48:24.139021+00:00
+886	9	7	2026-04-29	\N	2025-11-29T19:48:24.139021+00:00
+887	9	7	2026-04-30	\N	2025-11-29T19:48:24.139021+00:00
+888	9	7	2026-05-01	\N	2025-11-29T19:48:24.139021+00:00
+889	9	7	2026-05-02	\N	2025-11-29T19:48:24.139021+00:00
+890	9	7	2026-05-03	\N	2025-11-29T19:48:24.139021+00:00
+891	6	9	2026-05-05	\N	2025-11-29T19:48:24.139021+00:00
+892	6	9	2026-05-06	\N	2025-11-29T19:48:24.139021+00:00
+893	6	9	2026-05-07	\N	2025-11-29T19:48:24.139021+00:00
+894	6	9	2026-05-08	\N	2025-11-29T19:48:24.139021+00:00
+895	6	9	2026-05-09	\N	2025-11-29T19:48:24.139021+00:00
+896	9	5	2026-05-11	\N	2025-11-29T19:48:24.139021+00:00
+897	9	5	2026-05-12	\N	2025-11-29T19:48:24.139021+00:00
+898	9	5	2026-05-13	\N	2025-11-29T19:48:24.139021+00:00
+899	9	5	2026-05-14	\N	2025-11-29T19:48:24.139021+00:00
+900	9	5	2026-05-15	\N	2025-11-29T19:48:24.139021+00:00
+901	9	5	2026-05-16	\N	2025-11-29T19:48:24.139021+00:00
+902	8	9	2026-05-18	\N	2025-11-29T19:48:24.139021+00:00
+903	8	9	2026-05-19	\N	2025-11-29T19:48:24.139021+00:00
+904	8	9	2026-05-20	\N	2025-11-29T19:48:24.139021+00:00
+905	8	9	2026-05-21	\N	2025-11-29T19:48:24.139021+00:00
+906	8	9	2026-05-22	\N	2025-11-29T19:48:24.139021+00:00
+907	8	9	2026-05-23	\N	2025-11-29T19:48:24.139021+00:00
+908	9	1	2026-05-25	\N	2025-11-29T19:48:24.139021+00:00
+909	9	1	2026-05-26	\N	2025-11-29T19:48:24.139021+00:00
+910	9	1	2026-05-27	\N	2025-11-29T19:48:24.139021+00:00
+911	9	1	2026-05-28	\N	2025-11-29T19:48:24.139021+00:00
+912	9	1	2026-05-29	\N	2025-11-29T19:48:24.139021+00:00
+913	9	1	2026-05-30	\N	2025-11-29T19:48:24.139021+00:00
+914	7	9	2026-06-01	\N	2025-11-29T19:48:24.139021+00:00
+915	7	9	2026-06-02	\N	2025-11-29T19:48:24.139021+00:00
+916	7	9	2026-06-03	\N	2025-11-29T19:48:24.139021+00:00
+917	7	9	2026-06-04	\N	2025-11-29T19:48:24.139021+00:00
+918	7	9	2026-06-05	\N	2025-11-29T19:48:24.139021+00:00
+919	7	9	2026-06-06	\N	2025-11-29T19:48:24.139021+00:00
+920	9	2	2026-06-09	\N	2025-11-29T19:48:24.139021+00:00
+921	9	2	2026-06-10	\N	2025-11-29T19:48:24.139021+00:00
+922	9	2	2026-06-11	\N	2025-11-29T19:48:24.139021+00:00
+923	9	2	2026-06-12	\N	2025-11-29T19:48:24.139021+00:00
+924	9	2	2026-06-13	\N	2025-11-29T19:48:24.139021+00:00
+925	3	9	2026-06-15	\N	2025-11-29T19:48:24.139021+00:00
+926	3	9	2026-06-16	\N	2025-11-29T19:48:24.139021+00:00
+927	3	9	2026-06-17	\N	2025-11-29T19:48:24.139021+00:00
+928	3	9	2026-06-18	\N	2025-11-29T19:48:24.139021+00:00
+929	3	9	2026-06-19	\N	2025-11-29T19:48:24.139021+00:00
+930	3	9	2026-06-20	\N	2025-11-29T19:48:24.139021+00:00
+931	9	7	2026-06-23	\N	2025-11-29T19:48:24.139021+00:00
+932	9	7	2026-06-24	\N	2025-11-29T19:48:24.139021+00:00
+933	9	7	2026-06-25	\N	2025-11-29T19:48:24.139021+00:00
+934	9	7	2026-06-26	\N	2025-11-29T19:48:24.139021+00:00
+935	9	7	2026-06-27	\N	2025-11-29T19:48:24.139021+00:00
+936	2	9	2026-06-28	\N	2025-11-29T19:48:24.139021+00:00
+937	2	9	2026-06-29	\N	2025-11-29T19:48:24.139021+00:00
+938	2	9	2026-06-30	\N	2025-11-29T19:48:24.139021+00:00
+939	2	9	2026-07-01	\N	2025-11-29T19:48:24.139021+00:00
+940	2	9	2026-07-02	\N	2025-11-29T19:48:24.139021+00:00
+941	2	9	2026-07-03	\N	2025-11-29T19:48:24.139021+00:00
+942	1	9	2026-07-04	\N	2025-11-29T19:48:24.139021+00:00
+943	1	9	2026-07-05	\N	2025-11-29T19:48:24.139021+00:00
+944	1	9	2026-07-06	\N	2025-11-29T19:48:24.139021+00:00
+945	1	9	2026-07-07	\N	2025-11-29T19:48:24.139021+00:00
+946	1	9	2026-07-08	\N	2025-11-29T19:48:24.139021+00:00
+947	1	9	2026-07-09	\N	2025-11-29T19:48:24.139021+00:00
+948	9	10	2026-07-10	\N	2025-11-29T19:48:24.139021+00:00
+949	9	10	2026-07-11	\N	2025-11-29T19:48:24.139021+00:00
+950	9	10	2026-07-12	\N	2025-11-29T19:48:24.139021+00:00
+951	9	10	2026-07-13	\N	2025-11-29T19:48:24.139021+00:00
+952	10	9	2026-07-15	\N	2025-11-29T19:48:24.139021+00:00
+953	10	9	2026-07-16	\N	2025-11-29T19:48:24.139021+00:00
+954	10	9	2026-07-17	\N	2025-11-29T19:48:24.139021+00:00
+955	10	9	2026-07-18	\N	2025-11-29T19:48:24.139021+00:00
+956	10	9	2026-07-19	\N	2025-11-29T19:48:24.139021+00:00
+957	10	9	2026-07-20	\N	2025-11-29T19:48:24.139021+00:00
+958	9	4	2026-07-21	\N	2025-11-29T19:48:24.139021+00:00
+959	9	4	2026-07-22	\N	2025-11-29T19:48:24.139021+00:00
+960	9	4	2026-07-23	\N	2025-11-29T19:48:24.139021+00:00
+961	9	4	2026-07-24	\N	2025-11-29T19:48:24.139021+00:00
+962	9	1	2026-07-26	\N	2025-11-29T19:48:24.139021+00:00
+963	9	1	2026-07-27	\N	2025-11-29T19:48:24.139021+00:00
+964	9	1	2026-07-28	\N	2025-11-29T19:48:24.139021+00:00
+965	9	1	2026-07-29	\N	2025-11-29T19:48:24.139021+00:00
+966	9	1	2026-07-30	\N	2025-11-29T19:48:24.139021+00:00
+967	9	1	2026-08-02	\N	2025-11-29T19:48:24.139021+00:00
+968	9	1	2026-08-03	\N	2025-11-29T19:48:24.139021+00:00
+969	9	1	2026-08-04	\N	2025-11-29T19:48:24.139021+00:00
+970	6	9	2026-08-05	\N	2025-11-29T19:48:24.139021+00:00
+971	6	9	2026-08-06	\N	2025-11-29T19:48:24.139021+00:00
+972	6	9	2026-08-07	\N	2025-11-29T19:48:24.139021+00:00
+973	6	9	2026-08-08	\N	2025-11-29T19:48:24.139021+00:00
+974	6	9	2026-08-09	\N	2025-11-29T19:48:24.139021+00:00
+975	10	9	2026-08-11	\N	2025-11-29T19:48:24.139021+00:00
+976	10	9	2026-08-12	\N	2025-11-29T19:48:24.139021+00:00
+977	10	9	2026-08-13	\N	2025-11-29T19:48:24.139021+00:00
+978	10	9	2026-08-14	\N	2025-11-29T19:48:24.139021+00:00
+979	10	9	2026-08-15	\N	2025-11-29T19:48:24.139021+00:00
+980	10	9	2026-08-16	\N	2025-11-29T19:48:24.139021+00:00
+981	9	8	2026-08-18	\N	2025-11-29T19:48:24.139021+00:00
+982	9	8	2026-08-19	\N	2025-11-29T19:48:24.139021+00:00
+983	9	8	2026-08-20	\N	2025-11-29T19:48:24.139021+00:00
+984	9	8	2026-08-21	\N	2025-11-29T19:48:24.139021+00:00
+985	9	8	2026-08-22	\N	2025-11-29T19:48:24.139021+00:00
+986	9	8	2026-08-23	\N	2025-11-29T19:48:24.139021+00:00
+987	5	9	2026-08-25	\N	2025-11-29T19:48:24.139021+00:00
+988	5	9	2026-08-26	\N	2025-11-29T19:48:24.139021+00:00
+989	5	9	2026-08-27	\N	2025-11-29T19:48:24.139021+00:00
+990	5	9	2026-08-28	\N	2025-11-29T19:48:24.139021+00:00
+991	5	9	2026-08-29	\N	2025-11-29T19:48:24.139021+00:00
+992	5	9	2026-08-30	\N	2025-11-29T19:48:24.139021+00:00
+993	9	6	2026-09-01	\N	2025-11-29T19:48:24.139021+00:00
+994	9	6	2026-09-02	\N	2025-11-29T19:48:24.139021+00:00
+995	9	6	2026-09-03	\N	2025-11-29T19:48:24.139021+00:00
+996	9	6	2026-09-04	\N	2025-11-29T19:48:24.139021+00:00
+997	9	6	2026-09-05	\N	2025-11-29T19:48:24.139021+00:00
+998	1	9	2026-09-07	\N	2025-11-29T19:48:24.139021+00:00
+999	1	9	2026-09-08	\N	2025-11-29T19:48:24.139021+00:00
+1000	1	9	2026-09-09	\N	2025-11-29T19:48:24.139021+00:00
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_games', 'id'), (SELECT MAX(id) FROM clubhouse_games));
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- clubhouse_users: 1 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_users (id, slugger_user_id, user_name, user_role, team_id, created_at) FROM stdin;
+2	test_user_1	Test User	Clubhouse Manager	1	2025-11-29T20:01:58.452943+00:00
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_users', 'id'), (SELECT MAX(id) FROM clubhouse_users));
+
+COMMIT;
@@ -0,0 +1,1009 @@
+-- clubhouse_meals: 998 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_meals (id, game_id, pre_game_snack, post_game_meal) FROM stdin;
+1	1	\N	\N
+2	2	\N	\N
+3	3	\N	\N
+4	4	\N	\N
+5	5	\N	\N
+6	6	\N	\N
+7	7	\N	\N
+8	8	\N	\N
+9	9	\N	\N
+10	10	\N	\N
+11	11	\N	\N
+12	12	\N	\N
+13	13	\N	\N
+14	14	\N	\N
+15	15	\N	\N
+16	16	\N	\N
+17	17	\N	\N
+18	18	\N	\N
+19	19	\N	\N
+20	20	\N	\N
+21	21	\N	\N
+22	22	\N	\N
+23	23	\N	\N
+24	24	\N	\N
+25	25	\N	\N
+26	26	\N	\N
+27	27	\N	\N
+28	28	\N	\N
+29	29	\N	\N
+30	30	\N	\N
+31	31	\N	\N
+32	32	\N	\N
+33	33	\N	\N
+34	34	\N	\N
+35	35	\N	\N
+36	36	\N	\N
+37	37	\N	\N
+38	38	\N	\N
+39	39	\N	\N
+40	40	\N	\N
+41	41	\N	\N
+42	42	\N	\N
+43	43	\N	\N
+44	44	\N	\N
+45	45	\N	\N
+46	46	\N	\N
+47	47	\N	\N
+48	48	\N	\N
+49	49	\N	\N
+50	50	\N	\N
+51	51	\N	\N
+52	52	\N	\N
+53	53	\N	\N
+54	54	\N	\N
+55	55	\N	\N
+56	56	\N	\N
+57	57	\N	\N
+58	58	\N	\N
+59	59	\N	\N
+60	60	\N	\N
+61	61	\N	\N
+62	62	\N	\N
+63	63	\N	\N
+64	64	\N	\N
+65	65	\N	\N
+66	66	\N	\N
+67	67	\N	\N
+68	68	\N	\N
+69	69	\N	\N
+70	70	\N	\N
+71	71	\N	\N
+72	72	\N	\N
+73	73	\N	\N
+74	74	\N	\N
+75	75	\N	\N
+76	76	\N	\N
+77	77	\N	\N
+78	78	\N	\N
+79	79	\N	\N
+80	80	\N	\N
+81	81	\N	\N
+82	82	\N	\N
+83	83	\N	\N
+84	84	\N	\N
+85	85	\N	\N
+86	86	\N	\N
+87	87	\N	\N
+88	88	\N	\N
+89	89	\N	\N
+90	90	\N	\N
+91	91	\N	\N
+92	92	\N	\N
+93	93	\N	\N
+94	94	\N	\N
+95	95	\N	\N
+96	96	\N	\N
+97	97	\N	\N
+98	98	\N	\N
+99	99	\N	\N
+100	100	\N	\N
+101	101	\N	\N
+102	102	\N	\N
+103	103	\N	\N
+104	104	\N	\N
+105	105	\N	\N
+106	106	\N	\N
+107	107	\N	\N
+108	108	\N	\N
+109	109	\N	\N
+110	110	\N	\N
+111	111	\N	\N
+112	112	\N	\N
+113	113	\N	\N
+114	114	\N	\N
+115	115	\N	\N
+116	116	\N	\N
+117	117	\N	\N
+118	118	\N	\N
+119	119	\N	\N
+120	120	\N	\N
+121	121	\N	\N
+122	122	\N	\N
+123	123	\N	\N
+124	124	\N	\N
+125	125	\N	\N
+126	126	\N	\N
+127	127	\N	\N
+128	128	\N	\N
+129	129	\N	\N
+130	130	\N	\N
+131	131	\N	\N
+132	132	\N	\N
+133	133	\N	\N
+134	134	\N	\N
+135	135	\N	\N
+136	136	\N	\N
+137	137	\N	\N
+138	138	\N	\N
+139	139	\N	\N
+140	140	\N	\N
+141	141	\N	\N
+142	142	\N	\N
+143	143	\N	\N
+144	144	\N	\N
+145	145	\N	\N
+146	146	\N	\N
+147	147	\N	\N
+148	148	\N	\N
+149	149	\N	\N
+150	150	\N	\N
+151	151	\N	\N
+152	152	\N	\N
+153	153	\N	\N
+154	154	\N	\N
+155	155	\N	\N
+156	156	\N	\N
+157	157	\N	\N
+158	158	\N	\N
+159	159	\N	\N
+160	160	\N	\N
+161	161	\N	\N
+162	162	\N	\N
+163	163	\N	\N
+164	164	\N	\N
+165	165	\N	\N
+166	166	\N	\N
+167	167	\N	\N
+168	168	\N	\N
+169	169	\N	\N
+170	170	\N	\N
+171	171	\N	\N
+172	172	\N	\N
+173	173	\N	\N
+174	174	\N	\N
+175	175	\N	\N
+176	176	\N	\N
+177	177	\N	\N
+178	178	\N	\N
+179	179	\N	\N
+180	180	\N	\N
+181	181	\N	\N
+182	182	\N	\N
+183	183	\N	\N
+184	184	\N	\N
+185	185	\N	\N
+186	186	\N	\N
+187	187	\N	\N
+188	188	\N	\N
+189	189	\N	\N
+190	190	\N	\N
+191	191	\N	\N
+192	192	\N	\N
+193	193	\N	\N
+194	194	\N	\N
+195	195	\N	\N
+196	196	\N	\N
+197	197	\N	\N
+198	198	\N	\N
+199	199	\N	\N
+200	200	\N	\N
+201	201	\N	\N
+202	202	\N	\N
+203	203	\N	\N
+204	204	\N	\N
+205	205	\N	\N
+206	206	\N	\N
+207	207	\N	\N
+208	208	\N	\N
+209	209	\N	\N
+210	210	\N	\N
+211	211	\N	\N
+212	212	\N	\N
+213	213	\N	\N
+214	214	\N	\N
+215	215	\N	\N
+216	216	\N	\N
+217	217	\N	\N
+218	218	\N	\N
+219	219	\N	\N
+220	220	\N	\N
+221	221	\N	\N
+222	222	\N	\N
+223	223	\N	\N
+224	224	\N	\N
+225	225	\N	\N
+226	226	\N	\N
+227	227	\N	\N
+228	228	\N	\N
+229	229	\N	\N
+230	230	\N	\N
+231	231	\N	\N
+232	232	\N	\N
+233	233	\N	\N
+234	234	\N	\N
+235	235	\N	\N
+236	236	\N	\N
+237	237	\N	\N
+238	238	\N	\N
+239	239	\N	\N
+240	240	\N	\N
+241	241	\N	\N
+242	242	\N	\N
+243	243	\N	\N
+244	244	\N	\N
+245	245	\N	\N
+246	246	\N	\N
+248	248	\N	\N
+249	249	\N	\N
+250	250	\N	\N
+251	251	\N	\N
+252	252	\N	\N
+253	253	\N	\N
+254	254	\N	\N
+255	255	\N	\N
+256	256	\N	\N
+257	257	\N	\N
+258	258	\N	\N
+259	259	\N	\N
+260	260	\N	\N
+261	261	\N	\N
+262	262	\N	\N
+263	263	\N	\N
+264	264	\N	\N
+265	265	\N	\N
+266	266	\N	\N
+267	267	\N	\N
+268	268	\N	\N
+269	269	\N	\N
+270	270	\N	\N
+271	271	\N	\N
+272	272	\N	\N
+273	273	\N	\N
+274	274	\N	\N
+275	275	\N	\N
+276	276	\N	\N
+277	277	\N	\N
+278	278	\N	\N
+279	279	\N	\N
+280	280	\N	\N
+281	281	\N	\N
+282	282	\N	\N
+283	283	\N	\N
+284	284	\N	\N
+285	285	\N	\N
+286	286	\N	\N
+287	287	\N	\N
+288	288	\N	\N
+289	289	\N	\N
+290	290	\N	\N
+291	291	\N	\N
+292	292	\N	\N
+293	293	\N	\N
+294	294	\N	\N
+295	295	\N	\N
+296	296	\N	\N
+297	297	\N	\N
+298	298	\N	\N
+299	299	\N	\N
+300	300	\N	\N
+301	301	\N	\N
+302	302	\N	\N
+303	303	\N	\N
+304	304	\N	\N
+305	305	\N	\N
+306	306	\N	\N
+307	307	\N	\N
+308	308	\N	\N
+309	309	\N	\N
+310	310	\N	\N
+311	311	\N	\N
+312	312	\N	\N
+313	313	\N	\N
+314	314	\N	\N
+315	315	\N	\N
+316	316	\N	\N
+317	317	\N	\N
+318	318	\N	\N
+319	319	\N	\N
+320	320	\N	\N
+321	321	\N	\N
+322	322	\N	\N
+323	323	\N	\N
+324	324	\N	\N
+325	325	\N	\N
+326	326	\N	\N
+327	327	\N	\N
+328	328	\N	\N
+329	329	\N	\N
+330	330	\N	\N
+331	331	\N	\N
+332	332	\N	\N
+333	333	\N	\N
+334	334	\N	\N
+335	335	\N	\N
+336	336	\N	\N
+337	337	\N	\N
+338	338	\N	\N
+339	339	\N	\N
+340	340	\N	\N
+341	341	\N	\N
+342	342	\N	\N
+343	343	\N	\N
+344	344	\N	\N
+345	345	\N	\N
+346	346	\N	\N
+347	347	\N	\N
+348	348	\N	\N
+349	349	\N	\N
+350	350	\N	\N
+351	351	\N	\N
+352	352	\N	\N
+353	353	\N	\N
+354	354	\N	\N
+355	355	\N	\N
+356	356	\N	\N
+357	357	\N	\N
+358	358	\N	\N
+359	359	\N	\N
+360	360	\N	\N
+361	361	\N	\N
+362	362	\N	\N
+363	363	\N	\N
+364	364	\N	\N
+365	365	\N	\N
+366	366	\N	\N
+367	367	\N	\N
+368	368	\N	\N
+369	369	\N	\N
+370	370	\N	\N
+371	371	\N	\N
+372	372	\N	\N
+373	373	\N	\N
+374	374	\N	\N
+375	375	\N	\N
+376	376	\N	\N
+377	377	\N	\N
+378	378	\N	\N
+379	379	\N	\N
+380	380	\N	\N
+381	381	\N	\N
+382	382	\N	\N
+383	383	\N	\N
+384	384	\N	\N
+385	385	\N	\N
+386	386	\N	\N
+387	387	\N	\N
+388	388	\N	\N
+389	389	\N	\N
+390	390	\N	\N
+391	391	\N	\N
+392	392	\N	\N
+393	393	\N	\N
+394	394	\N	\N
+395	395	\N	\N
+396	396	\N	\N
+397	397	\N	\N
+398	398	\N	\N
+399	399	\N	\N
+400	400	\N	\N
+401	401	\N	\N
+402	402	\N	\N
+403	403	\N	\N
+404	404	\N	\N
+405	405	\N	\N
+406	406	\N	\N
+407	407	\N	\N
+408	408	\N	\N
+409	409	\N	\N
+410	410	\N	\N
+411	411	\N	\N
+412	412	\N	\N
+413	413	\N	\N
+414	414	\N	\N
+415	415	\N	\N
+416	416	\N	\N
+417	417	\N	\N
+418	418	\N	\N
+419	419	\N	\N
+420	420	\N	\N
+421	421	\N	\N
+422	422	\N	\N
+423	423	\N	\N
+424	424	\N	\N
+425	425	\N	\N
+426	426	\N	\N
+427	427	\N	\N
+428	428	\N	\N
+429	429	\N	\N
+430	430	\N	\N
+431	431	\N	\N
+432	432	\N	\N
+433	433	\N	\N
+434	434	\N	\N
+435	435	\N	\N
+436	436	\N	\N
+437	437	\N	\N
+438	438	\N	\N
+439	439	\N	\N
+440	440	\N	\N
+441	441	\N	\N
+442	442	\N	\N
+443	443	\N	\N
+444	444	\N	\N
+445	445	\N	\N
+446	446	\N	\N
+447	447	\N	\N
+448	448	\N	\N
+449	449	\N	\N
+450	450	\N	\N
+451	451	\N	\N
+452	452	\N	\N
+453	453	\N	\N
+454	454	\N	\N
+455	455	\N	\N
+456	456	\N	\N
+457	457	\N	\N
+458	458	\N	\N
+459	459	\N	\N
+460	460	\N	\N
+461	461	\N	\N
+462	462	\N	\N
+463	463	\N	\N
+464	464	\N	\N
+465	465	\N	\N
+466	466	\N	\N
+467	467	\N	\N
+468	468	\N	\N
+469	469	\N	\N
+470	470	\N	\N
+471	471	\N	\N
+472	472	\N	\N
+473	473	\N	\N
+474	474	\N	\N
+475	475	\N	\N
+476	476	\N	\N
+477	477	\N	\N
+478	478	\N	\N
+479	479	\N	\N
+480	480	\N	\N
+481	481	\N	\N
+482	482	\N	\N
+483	483	\N	\N
+484	484	\N	\N
+485	485	\N	\N
+486	486	\N	\N
+487	487	\N	\N
+488	488	\N	\N
+489	489	\N	\N
+490	490	\N	\N
+491	491	\N	\N
+492	492	\N	\N
+493	493	\N	\N
+494	494	\N	\N
+495	495	\N	\N
+496	496	\N	\N
+497	497	\N	\N
+498	498	\N	\N
+499	499	\N	\N
+500	500	\N	\N
+501	501	\N	\N
+502	502	\N	\N
+503	503	\N	\N
+504	504	\N	\N
+505	505	\N	\N
+506	506	\N	\N
+507	507	\N	\N
+508	508	\N	\N
+509	509	\N	\N
+510	510	\N	\N
+511	511	\N	\N
+512	512	\N	\N
+513	513	\N	\N
+514	514	\N	\N
+515	515	\N	\N
+516	516	\N	\N
+517	517	\N	\N
+518	518	\N	\N
+519	519	\N	\N
+520	520	\N	\N
+521	521	\N	\N
+522	522	\N	\N
+523	523	\N	\N
+524	524	\N	\N
+525	525	\N	\N
+526	526	\N	\N
+527	527	\N	\N
+528	528	\N	\N
+529	529	\N	\N
+530	530	\N	\N
+531	531	\N	\N
+532	532	\N	\N
+533	533	\N	\N
+534	534	\N	\N
+535	535	\N	\N
+536	536	\N	\N
+537	537	\N	\N
+538	538	\N	\N
+539	539	\N	\N
+540	540	\N	\N
+541	541	\N	\N
+542	542	\N	\N
+543	543	\N	\N
+544	544	\N	\N
+545	545	\N	\N
+546	546	\N	\N
+547	547	\N	\N
+548	548	\N	\N
+549	549	\N	\N
+550	550	\N	\N
+551	551	\N	\N
+552	552	\N	\N
+553	553	\N	\N
+554	554	\N	\N
+555	555	\N	\N
+556	556	\N	\N
+557	557	\N	\N
+558	558	\N	\N
+559	559	\N	\N
+560	560	\N	\N
+561	561	\N	\N
+562	562	\N	\N
+563	563	\N	\N
+564	564	\N	\N
+565	565	\N	\N
+566	566	\N	\N
+567	567	\N	\N
+568	568	\N	\N
+569	569	\N	\N
+570	570	\N	\N
+571	571	\N	\N
+572	572	\N	\N
+573	573	\N	\N
+574	574	\N	\N
+575	575	\N	\N
+576	576	\N	\N
+577	577	\N	\N
+578	578	\N	\N
+579	579	\N	\N
+580	580	\N	\N
+581	581	\N	\N
+582	582	\N	\N
+583	583	\N	\N
+584	584	\N	\N
+585	585	\N	\N
+586	586	\N	\N
+587	587	\N	\N
+588	588	\N	\N
+589	589	\N	\N
+590	590	\N	\N
+591	591	\N	\N
+592	592	\N	\N
+593	593	\N	\N
+594	594	\N	\N
+595	595	\N	\N
+596	596	\N	\N
+597	597	\N	\N
+598	598	\N	\N
+599	599	\N	\N
+600	600	\N	\N
+601	601	\N	\N
+602	602	\N	\N
+603	603	\N	\N
+604	604	\N	\N
+605	605	\N	\N
+606	606	\N	\N
+607	607	\N	\N
+608	608	\N	\N
+609	609	\N	\N
+610	610	\N	\N
+611	611	\N	\N
+612	612	\N	\N
+613	613	\N	\N
+614	614	\N	\N
+615	615	\N	\N
+616	616	\N	\N
+617	617	\N	\N
+618	618	\N	\N
+619	619	\N	\N
+620	620	\N	\N
+621	621	\N	\N
+622	622	\N	\N
+623	623	\N	\N
+624	624	\N	\N
+625	625	\N	\N
+626	626	\N	\N
+627	627	\N	\N
+628	628	\N	\N
+629	629	\N	\N
+630	630	\N	\N
+631	631	\N	\N
+632	632	\N	\N
+633	633	\N	\N
+634	634	\N	\N
+635	635	\N	\N
+637	637	\N	\N
+638	638	\N	\N
+639	639	\N	\N
+640	640	\N	\N
+641	641	\N	\N
+642	642	\N	\N
+643	643	\N	\N
+644	644	\N	\N
+645	645	\N	\N
+646	646	\N	\N
+647	647	\N	\N
+648	648	\N	\N
+649	649	\N	\N
+650	650	\N	\N
+651	651	\N	\N
+652	652	\N	\N
+653	653	\N	\N
+654	654	\N	\N
+655	655	\N	\N
+656	656	\N	\N
+657	657	\N	\N
+658	658	\N	\N
+659	659	\N	\N
+660	660	\N	\N
+661	661	\N	\N
+662	662	\N	\N
+663	663	\N	\N
+664	664	\N	\N
+665	665	\N	\N
+666	666	\N	\N
+667	667	\N	\N
+668	668	\N	\N
+669	669	\N	\N
+670	670	\N	\N
+671	671	\N	\N
+672	672	\N	\N
+673	673	\N	\N
+674	674	\N	\N
+675	675	\N	\N
+676	676	\N	\N
+677	677	\N	\N
+678	678	\N	\N
+679	679	\N	\N
+680	680	\N	\N
+681	681	\N	\N
+682	682	\N	\N
+683	683	\N	\N
+684	684	\N	\N
+685	685	\N	\N
+686	686	\N	\N
+687	687	\N	\N
+688	688	\N	\N
+689	689	\N	\N
+690	690	\N	\N
+691	691	\N	\N
+692	692	\N	\N
+693	693	\N	\N
+694	694	\N	\N
+695	695	\N	\N
+696	696	\N	\N
+697	697	\N	\N
+698	698	\N	\N
+699	699	\N	\N
+700	700	\N	\N
+701	701	\N	\N
+702	702	\N	\N
+703	703	\N	\N
+704	704	\N	\N
+705	705	\N	\N
+706	706	\N	\N
+707	707	\N	\N
+708	708	\N	\N
+709	709	\N	\N
+710	710	\N	\N
+711	711	\N	\N
+712	712	\N	\N
+713	713	\N	\N
+714	714	\N	\N
+715	715	\N	\N
+716	716	\N	\N
+717	717	\N	\N
+718	718	\N	\N
+719	719	\N	\N
+720	720	\N	\N
+721	721	\N	\N
+722	722	\N	\N
+723	723	\N	\N
+724	724	\N	\N
+725	725	\N	\N
+726	726	\N	\N
+727	727	\N	\N
+728	728	\N	\N
+729	729	\N	\N
+730	730	\N	\N
+731	731	\N	\N
+732	732	\N	\N
+733	733	\N	\N
+734	734	\N	\N
+735	735	\N	\N
+736	736	\N	\N
+737	737	\N	\N
+738	738	\N	\N
+739	739	\N	\N
+740	740	\N	\N
+741	741	\N	\N
+742	742	\N	\N
+743	743	\N	\N
+744	744	\N	\N
+745	745	\N	\N
+746	746	\N	\N
+747	747	\N	\N
+748	748	\N	\N
+749	749	\N	\N
+750	750	\N	\N
+751	751	\N	\N
+752	752	\N	\N
+753	753	\N	\N
+754	754	\N	\N
+755	755	\N	\N
+756	756	\N	\N
+757	757	\N	\N
+758	758	\N	\N
+759	759	\N	\N
+760	760	\N	\N
+761	761	\N	\N
+762	762	\N	\N
+763	763	\N	\N
+764	764	\N	\N
+765	765	\N	\N
+766	766	\N	\N
+767	767	\N	\N
+768	768	\N	\N
+769	769	\N	\N
+770	770	\N	\N
+771	771	\N	\N
+772	772	\N	\N
+773	773	\N	\N
+774	774	\N	\N
+775	775	\N	\N
+776	776	\N	\N
+777	777	\N	\N
+778	778	\N	\N
+779	779	\N	\N
+780	780	\N	\N
+781	781	\N	\N
+782	782	\N	\N
+783	783	\N	\N
+784	784	\N	\N
+785	785	\N	\N
+786	786	\N	\N
+787	787	\N	\N
+788	788	\N	\N
+789	789	\N	\N
+790	790	\N	\N
+791	791	\N	\N
+792	792	\N	\N
+793	793	\N	\N
+794	794	\N	\N
+795	795	\N	\N
+796	796	\N	\N
+797	797	\N	\N
+798	798	\N	\N
+799	799	\N	\N
+800	800	\N	\N
+801	801	\N	\N
+802	802	\N	\N
+803	803	\N	\N
+804	804	\N	\N
+805	805	\N	\N
+806	806	\N	\N
+807	807	\N	\N
+808	808	\N	\N
+809	809	\N	\N
+810	810	\N	\N
+811	811	\N	\N
+812	812	\N	\N
+813	813	\N	\N
+814	814	\N	\N
+815	815	\N	\N
+816	816	\N	\N
+817	817	\N	\N
+818	818	\N	\N
+819	819	\N	\N
+820	820	\N	\N
+821	821	\N	\N
+822	822	\N	\N
+823	823	\N	\N
+824	824	\N	\N
+825	825	\N	\N
+826	826	\N	\N
+827	827	\N	\N
+828	828	\N	\N
+829	829	\N	\N
+830	830	\N	\N
+831	831	\N	\N
+832	832	\N	\N
+833	833	\N	\N
+834	834	\N	\N
+835	835	\N	\N
+836	836	\N	\N
+837	837	\N	\N
+838	838	\N	\N
+839	839	\N	\N
+840	840	\N	\N
+841	841	\N	\N
+842	842	\N	\N
+843	843	\N	\N
+844	844	\N	\N
+845	845	\N	\N
+846	846	\N	\N
+847	847	\N	\N
+848	848	\N	\N
+849	849	\N	\N
+850	850	\N	\N
+851	851	\N	\N
+852	852	\N	\N
+853	853	\N	\N
+854	854	\N	\N
+855	855	\N	\N
+856	856	\N	\N
+857	857	\N	\N
+858	858	\N	\N
+859	859	\N	\N
+860	860	\N	\N
+861	861	\N	\N
+862	862	\N	\N
+863	863	\N	\N
+864	864	\N	\N
+865	865	\N	\N
+866	866	\N	\N
+867	867	\N	\N
+868	868	\N	\N
+869	869	\N	\N
+870	870	\N	\N
+871	871	\N	\N
+872	872	\N	\N
+873	873	\N	\N
+874	874	\N	\N
+875	875	\N	\N
+876	876	\N	\N
+877	877	\N	\N
+878	878	\N	\N
+879	879	\N	\N
+880	880	\N	\N
+881	881	\N	\N
+882	882	\N	\N
+883	883	\N	\N
+884	884	\N	\N
+885	885	\N	\N
+886	886	\N	\N
+887	887	\N	\N
+888	888	\N	\N
+889	889	\N	\N
+890	890	\N	\N
+891	891	\N	\N
+892	892	\N	\N
+893	893	\N	\N
+894	894	\N	\N
+895	895	\N	\N
+896	896	\N	\N
+897	897	\N	\N
+898	898	\N	\N
+899	899	\N	\N
+900	900	\N	\N
+901	901	\N	\N
+902	902	\N	\N
+903	903	\N	\N
+904	904	\N	\N
+905	905	\N	\N
+906	906	\N	\N
+907	907	\N	\N
+908	908	\N	\N
+909	909	\N	\N
+910	910	\N	\N
+911	911	\N	\N
+912	912	\N	\N
+913	913	\N	\N
+914	914	\N	\N
+915	915	\N	\N
+916	916	\N	\N
+917	917	\N	\N
+918	918	\N	\N
+919	919	\N	\N
+920	920	\N	\N
+921	921	\N	\N
+922	922	\N	\N
+923	923	\N	\N
+924	924	\N	\N
+925	925	\N	\N
+926	926	\N	\N
+927	927	\N	\N
+928	928	\N	\N
+929	929	\N	\N
+930	930	\N	\N
+931	931	\N	\N
+932	932	\N	\N
+933	933	\N	\N
+934	934	\N	\N
+935	935	\N	\N
+936	936	\N	\N
+937	937	\N	\N
+938	938	\N	\N
+939	939	\N	\N
+940	940	\N	\N
+941	941	\N	\N
+942	942	\N	\N
+943	943	\N	\N
+944	944	\N	\N
+945	945	\N	\N
+946	946	\N	\N
+947	947	\N	\N
+948	948	\N	\N
+949	949	\N	\N
+950	950	\N	\N
+951	951	\N	\N
+952	952	\N	\N
+953	953	\N	\N
+954	954	\N	\N
+955	955	\N	\N
+956	956	\N	\N
+957	957	\N	\N
+958	958	\N	\N
+959	959	\N	\N
+960	960	\N	\N
+961	961	\N	\N
+962	962	\N	\N
+963	963	\N	\N
+964	964	\N	\N
+965	965	\N	\N
+966	966	\N	\N
+967	967	\N	\N
+968	968	\N	\N
+969	969	\N	\N
+970	970	\N	\N
+971	971	\N	\N
+972	972	\N	\N
+973	973	\N	\N
+974	974	\N	\N
+975	975	\N	\N
+976	976	\N	\N
+977	977	\N	\N
+978	978	\N	\N
+979	979	\N	\N
+980	980	\N	\N
+981	981	\N	\N
+982	982	\N	\N
+983	983	\N	\N
+984	984	\N	\N
+985	985	\N	\N
+986	986	\N	\N
+987	987	\N	\N
+988	988	\N	\N
+989	989	\N	\N
+990	990	\N	\N
+991	991	\N	\N
+992	992	\N	\N
+993	993	\N	\N
+994	994	\N	\N
+995	995	\N	\N
+996	996	\N	\N
+997	997	\N	\N
+998	998	\N	\N
+999	999	\N	\N
+1000	1000	\N	\N
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_meals', 'id'), (SELECT MAX(id) FROM clubhouse_meals));
+
+COMMIT;
@@ -0,0 +1,28 @@
+-- clubhouse_tasks: 17 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_tasks (id, user_id, task_name, task_description, task_complete, task_category, task_type, task_date, task_time, is_repeating, repeating_day, created_at) FROM stdin;
+54	2	Prep home clubhouse	Open clubhouse and ensure space is clean, stocked, and ready	f	Hygiene & Personal Care	1	\N	12:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+55	2	Restock all hygiene supplies	Restock soap, shampoo, toilet paper, disinfectants	f	Hygiene & Personal Care	1	\N	11:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+56	2	Prepare pre-game snacks	Set out fruit and snacks according to league nutrition standards	f	Meals & Nutrition	1	\N	13:15:00	t	\N	2025-12-10T01:57:17.80241+00:00
+57	2	Pick up pre-game meal	Coordinate with assistant to bring in pre-game food items	f	Meals & Nutrition	1	\N	12:45:00	t	\N	2025-12-10T01:57:17.80241+00:00
+58	2	Greet visiting team	Meet bus, assist team with setup, confirm special requests	f	Equipment & Field Support	1	\N	14:45:00	t	\N	2025-12-10T01:57:17.80241+00:00
+59	2	Monitor BP schedule	Adjust workflow around team hitting schedules	f	Misc	1	\N	15:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+60	2	Fulfill store-run requests	Get requested items (e.g., drinks, snacks) for players/coaches	f	Misc	1	\N	16:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+61	2	Process pre-game laundry	Wash BP clothing, towels, early workout gear	f	Laundry & Cleaning	1	\N	17:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+62	2	Coordinate post-game meal pickup	Send staff to pick up catered post-game meal during game	f	Meals & Nutrition	1	\N	19:30:00	t	\N	2025-12-10T01:57:17.80241+00:00
+63	2	Maintain clubhouse cleanliness	Continuous cleaning, trash removal, surface sanitation	f	Laundry & Cleaning	1	\N	17:30:00	t	\N	2025-12-10T01:57:17.80241+00:00
+64	2	Prep post-game towels	Restock clean towels and prepare laundry bins by 7th inning	f	Laundry & Cleaning	1	\N	20:30:00	t	\N	2025-12-10T01:57:17.80241+00:00
+65	2	Set up post-game meal	Prepare dining area for post-game food service	f	Meals & Nutrition	1	\N	21:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+66	2	Handle post-game laundry	Wash, dry, fold, and reset both home and visiting uniforms/towels	f	Laundry & Cleaning	1	\N	22:15:00	t	\N	2025-12-10T01:57:17.80241+00:00
+67	2	End-of-day sanitation	Clean bathrooms, showers, weight room, and clubhouse areas	f	Hygiene & Personal Care	1	\N	23:00:00	t	\N	2025-12-10T01:57:17.80241+00:00
+68	2	Reset clubhouse for next day	Ensure clubhouse is fully ready for next game day before leaving	f	Equipment & Field Support	1	\N	23:30:00	t	\N	2025-12-10T01:57:17.80241+00:00
+69	2	Verify AED & safety equipment	Check AED, first-aid supplies, and emergency equipment	f	Medical & Safety	1	\N	10:15:00	t	\N	2025-12-10T01:57:17.80241+00:00
+70	2	Post emergency contact info	Ensure emergency numbers and medical info sheets are posted visibly	f	Medical & Safety	1	\N	10:20:00	t	\N	2025-12-10T01:57:17.80241+00:00
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_tasks', 'id'), (SELECT MAX(id) FROM clubhouse_tasks));
+
+COMMIT;
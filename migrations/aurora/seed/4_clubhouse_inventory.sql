@@ -0,0 +1,12 @@
+-- clubhouse_inventory: 1 rows
+-- Generated by compile_seed_data.py, do not edit by hand
+
+BEGIN;
+
+COPY clubhouse_inventory (id, team_id, meal_id, inventory_type, inventory_item, current_stock, required_stock, unit, purchase_link, note, price_per_unit, created_at) FROM stdin;
+14	1	\N	Laundry & Cleaning	Laundry Detergent	3	3	unit	https://www.amazon.com/Amazon-Basics-Concentrated-Detergent-Lavender/dp/B09CLS6DYH/ref=sr_1_1_ffob_sspa?adgrpid=181681097970&dib=eyJ2IjoiMSJ9.5ltyXm0OzSm0t1G5temZtfnaIJFos2t66W7rvewidPLi5lz3hJQGXTZ9ICQ7i8qmSBH4aw4uiYMCGmqYqhNxGRArAJ2UcOBI7KP39sGKWzEYFWtA7b6V03pYyFd5h2msKgHNcF4ys-VNm-90hqyJxqgAtU7xA5eLwybpPr77SVLNfukUJhiIerFpJ2vuEw96lRs-2sMJQ_faHUJmmSSwFW7D4eQfnvODmTDy0c7QRJrsCk1yU4jIh-BUgqBSx5i-YE2W5oCF4QrYs_iQPVB9W3yGDh7PGbn7uiZI5tDyYD8.fiBmCQlqyOzxfJFx5qswhM9kMPenTvGBmaymsBGk_AE&dib_tag=se&hvadid=779731347576&hvdev=c&hvexpln=0&hvlocphy=9007909&hvnetw=g&hvocijid=6607415758386704462--&hvqmt=e&hvrand=6607415758386704462&hvtargid=kwd-324150470120&hydadcr=24630_13611748_8888&keywords=laundry%2Bdetergent%2Bamazon&mcid=21f905b4be6737c486408e8544c799c9&qid=1765489031&rdc=1&sr=8-1-spons&sp_csd=d2lkZ2V0TmFtZT1zcF9hdGY&th=1	\N	7	2025-12-11T21:57:41.045044+00:00
+\.
+
+SELECT setval(pg_get_serial_sequence('clubhouse_inventory', 'id'), (SELECT MAX(id) FROM clubhouse_inventory));
+
+COMMIT;
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Seed Data Compiler for ClubhouseWidget
+Turns a JSON snapshot of the Supabase tables into Aurora seed files
+
+Reads supabase_export/*.json (or any directory of per-table JSON exports)
+and writes one COPY ... FROM stdin file per clubhouse_* table, preserving
+ids and resetting the identity sequences. Files that share a level prefix
+have no foreign keys between them and can be applied in parallel with psql.
+
+No database connection or third-party packages needed.
+"""
+
+import os
+import sys
+import json
+import argparse
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SNAPSHOT_DIR = os.path.join(SCRIPT_DIR, 'supabase_export')
+DEFAULT_OUTPUT_DIR = os.path.join(SCRIPT_DIR, 'aurora')
+
+# Aurora table -> snapshot file names, target columns, load level
+# Column aliases cover Supabase column names that differ from Aurora's.
+# References map FK columns to (parent table, nullable): rows whose parent
+# is not emitted get the column set to NULL if nullable, else are dropped.
+SEED_TABLES = [
+    {
+        'table': 'clubhouse_teams',
+        'sources': ['teams'],
+        'columns': ['id', 'team_name', 'slugger_team_id', 'created_at'],
+        'aliases': {},
+        'references': {},
+        'level': 1
+    },
+    {
+        'table': 'clubhouse_users',
+        'sources': ['user', 'users'],
+        'columns': ['id', 'slugger_user_id', 'user_name', 'user_role', 'team_id', 'created_at'],
+        'aliases': {'team_id': 'user_team'},
+        'references': {'team_id': ('clubhouse_teams', True)},
+        'level': 2
+    },
+    {
+        'table': 'clubhouse_games',
+        'sources': ['games'],
+        'columns': ['id', 'home_team_id', 'away_team_id', 'date', 'time', 'created_at'],
+        'aliases': {},
+        'references': {'home_team_id': ('clubhouse_teams', False), 'away_team_id': ('clubhouse_teams', False)},
+        'level': 2
+    },
+    {
+        'table': 'clubhouse_tasks',
+        'sources': ['task', 'tasks'],
+        'columns': ['id', 'user_id', 'task_name', 'task_description', 'task_complete',
+                    'task_category', 'task_type', 'task_date', 'task_time',
+                    'is_repeating', 'repeating_day', 'created_at'],
+        'aliases': {},
+        'references': {'user_id': ('clubhouse_users', False)},
+        'level': 3
+    },
+    {
+        'table': 'clubhouse_meals',
+        'sources': ['meals'],
+        'columns': ['id', 'game_id', 'pre_game_snack', 'post_game_meal', 'created_at'],
+        'aliases': {},
+        'references': {'game_id': ('clubhouse_games', False)},
+        'level': 3
+    },
+    {
+        'table': 'clubhouse_inventory',
+        'sources': ['inventory'],
+        'columns': ['id', 'team_id', 'meal_id', 'inventory_type', 'inventory_item',
+                    'current_stock', 'required_stock', 'unit', 'purchase_link',
+                    'note', 'price_per_unit', 'created_at'],
+        'aliases': {},
+        'references': {'team_id': ('clubhouse_teams', True), 'meal_id': ('clubhouse_meals', True)},
+        'level': 4
+    }
+]
+
+
+class MigrationLogger:
+    @staticmethod
+    def info(message: str):
+        print(f"[INFO] {datetime.now().strftime('%H:%M:%S')} - {message}")
+    
+    @staticmethod
+    def success(message: str):
+        print(f"[SUCCESS] {datetime.now().strftime('%H:%M:%S')} - ✓ {message}")
+    
+    @staticmethod
+    def error(message: str):
+        print(f"[ERROR] {datetime.now().strftime('%H:%M:%S')} - ✗ {message}")
+    
+    @staticmethod
+    def warning(message: str):
+        print(f"[WARNING] {datetime.now().strftime('%H:%M:%S')} - ⚠ {message}")
+
+
+def find_snapshot_file(snapshot_dir: str, sources: List[str]) -> Optional[str]:
+    """
+    Locate the JSON export for a table
+    Accepts both supabase_export naming (teams_data.json) and the
+    migration script's export naming (teams.json)
+    """
+    for source in sources:
+        for file_name in (f'{source}_data.json', f'{source}.json'):
+            path = os.path.join(snapshot_dir, file_name)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def read_row_counts(snapshot_dir: str) -> Dict[str, int]:
+    """Parse the optional row_counts.txt ("games: 1132 rows") written next to an export"""
+    counts = {}
+    path = os.path.join(snapshot_dir, 'row_counts.txt')
+    if not os.path.exists(path):
+        return counts
+    
+    with open(path, 'r') as f:
+        for line in f:
+            name, _, rest = line.partition(':')
+            value = rest.split()
+            if value and value[0].isdigit():
+                counts[name.strip()] = int(value[0])
+    
+    return counts
+
+
+def load_snapshot(snapshot_dir: str) -> Dict[str, List[Dict]]:
+    """
+    Read every table of a snapshot directory
+    Returns dict of {aurora_table: rows}, missing tables map to []
+    """
+    snapshot = {}
+    expected = read_row_counts(snapshot_dir)
+    
+    for spec in SEED_TABLES:
+        path = find_snapshot_file(snapshot_dir, spec['sources'])
+        if not path:
+            MigrationLogger.warning(f"No snapshot file for {spec['table']} in {snapshot_dir}")
+            snapshot[spec['table']] = []
+            continue
+        
+        with open(path, 'r') as f:
+            snapshot[spec['table']] = json.load(f)
+        MigrationLogger.info(f"Read {len(snapshot[spec['table']])} rows for {spec['table']} from {os.path.basename(path)}")
+        
+        expected_rows = next((expected[source] for source in spec['sources'] if source in expected), None)
+        if expected_rows is not None and expected_rows != len(snapshot[spec['table']]):
+            MigrationLogger.warning(
+                f"{spec['table']}: snapshot has {len(snapshot[spec['table']])} rows but row_counts.txt "
+                f"lists {expected_rows}, the export may have been truncated"
+            )
+    
+    return snapshot
+
+
+def resolve_references(snapshot: Dict[str, List[Dict]]) -> Tuple[Dict[str, List[Dict]], int]:
+    """
+    Check every row's parent ids against the rows that will be emitted
+    Returns ({aurora_table: loadable rows}, number of rows dropped or nulled)
+    
+    Tables are resolved in level order, so a row whose parent was itself
+    dropped is handled the same way as a row whose parent was never exported.
+    """
+    resolved = {}
+    emitted_ids = {}
+    problems = 0
+    
+    for spec in sorted(SEED_TABLES, key=lambda s: s['level']):
+        table = spec['table']
+        rows = []
+        dropped = []
+        nulled = []
+        
+        for row in snapshot[table]:
+            keep = True
+            for column, (parent, nullable) in spec['references'].items():
+                key = column if column in row else spec['aliases'].get(column, column)
+                value = row.get(key)
+                if value is None or value in emitted_ids[parent]:
+                    continue
+                
+                if nullable:
+                    row = dict(row, **{key: None})
+                    nulled.append(f"{row.get('id')} ({column}={value})")
+                else:
+                    keep = False
+                    dropped.append(f"{row.get('id')} ({column}={value})")
+                    break
+            
+            if keep:
+                rows.append(row)
+        
+        if dropped:
+            MigrationLogger.warning(
+                f"{table}: dropping {len(dropped)} rows whose parent is not in the snapshot: "
+                f"{', '.join(dropped[:5])}{' ...' if len(dropped) > 5 else ''}"
+            )
+        if nulled:
+            MigrationLogger.warning(
+                f"{table}: setting missing references to NULL in {len(nulled)} rows: "
+                f"{', '.join(nulled[:5])}{' ...' if len(nulled) > 5 else ''}"
+            )
+        
+        problems += len(dropped) + len(nulled)
+        resolved[table] = rows
+        emitted_ids[table] = {row.get('id') for row in rows}
+    
+    return resolved, problems
+
+
+def copy_value(value) -> str:
+    """Encode one value in COPY text format"""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    
+    return (
+        str(value)
+        .replace('\\', '\\\\')
+        .replace('\t', '\\t')
+        .replace('\n', '\\n')
+        .replace('\r', '\\r')
+    )
+
+
+def compile_table(spec: Dict, rows: List[Dict]) -> str:
+    """
+    Build the seed SQL for one table: a COPY block with explicit ids
+    followed by a sequence reset
+    """
+    table = spec['table']
+    
+    def source_key(column: str) -> str:
+        return spec['aliases'].get(column, column)
+    
+    # Only copy columns the snapshot actually has, so the rest keep their defaults
+    columns = [
+        column for column in spec['columns']
+        if any(source_key(column) in row or column in row for row in rows)
+    ]
+    
+    lines = [
+        f"-- {table}: {len(rows)} rows",
+        "-- Generated by compile_seed_data.py, do not edit by hand",
+        "",
+        "BEGIN;",
+        ""
+    ]
+    
+    # An empty COPY column list is a syntax error, so empty tables get no COPY block
+    if not rows:
+        lines += [
+            "-- Nothing to load: the snapshot has no rows for this table",
+            "",
+            "COMMIT;",
+            ""
+        ]
+        return '\n'.join(lines)
+    
+    lines.append(f"COPY {table} ({', '.join(columns)}) FROM stdin;")
+    
+    for row in sorted(rows, key=lambda r: r.get('id') or 0):
+        values = [row.get(column, row.get(source_key(column))) for column in columns]
+        lines.append('\t'.join(copy_value(value) for value in values))
+    
+    lines += [
+        "\\.",
+        "",
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT MAX(id) FROM {table}));",
+        "",
+        "COMMIT;",
+        ""
+    ]
+    return '\n'.join(lines)
+
+
+def seed_file_name(spec: Dict) -> str:
+    """Per-table seed file name, prefixed with its load level"""
+    return f"{spec['level']}_{spec['table']}.sql"
+
+
+def compile_index(snapshot_dir: str, snapshot: Dict[str, List[Dict]], seed_dir_name: str) -> str:
+    """Build 002_seed_data.sql, which applies the per-table files in level order"""
+    lines = [
+        "-- ClubhouseWidget Seed Data",
+        "-- Run this AFTER 001_initial_schema.sql",
+        "--",
+        f"-- Generated by compile_seed_data.py from {os.path.relpath(snapshot_dir, SCRIPT_DIR)}",
+        f"-- Compile date: {datetime.now().strftime('%Y-%m-%d')}",
+        "--",
+        f"-- Applies the per-table COPY files in {seed_dir_name}/ one at a time. For a",
+        "-- faster load, apply them level by level instead; files with the same",
+        "-- level prefix can run in parallel:",
+        "--",
+        "--   for level in 1 2 3 4; do",
+        f"--     ls {seed_dir_name}/${{level}}_*.sql | xargs -P 0 -n 1 psql \"$AURORA_DB_URL\" -v ON_ERROR_STOP=1 -f",
+        "--   done",
+        "",
+        "\\set ON_ERROR_STOP on",
+        ""
+    ]
+    
+    for spec in sorted(SEED_TABLES, key=lambda s: s['level']):
+        lines.append(f"-- {spec['table']} ({len(snapshot[spec['table']])} rows)")
+        lines.append(f"\\ir {seed_dir_name}/{seed_file_name(spec)}")
+    
+    lines.append("")
+    return '\n'.join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compile a Supabase JSON snapshot into Aurora COPY seed files")
+    parser.add_argument('--snapshot', default=DEFAULT_SNAPSHOT_DIR,
+                        help="Directory of per-table JSON exports (default: supabase_export/)")
+    parser.add_argument('--output', default=DEFAULT_OUTPUT_DIR,
+                        help="Directory receiving 002_seed_data.sql and seed/ (default: aurora/)")
+    parser.add_argument('--strict', action='store_true',
+                        help="Fail instead of dropping or nulling rows whose parent is not in the snapshot")
+    args = parser.parse_args()
+    
+    if not os.path.isdir(args.snapshot):
+        MigrationLogger.error(f"Snapshot directory not found: {args.snapshot}")
+        sys.exit(1)
+    
+    snapshot, problems = resolve_references(load_snapshot(args.snapshot))
+    if problems and args.strict:
+        MigrationLogger.error(f"{problems} rows reference parents missing from the snapshot, nothing written")
+        sys.exit(1)
+    
+    seed_dir_name = 'seed'
+    seed_dir = os.path.join(args.output, seed_dir_name)
+    os.makedirs(seed_dir, exist_ok=True)
+    
+    for spec in SEED_TABLES:
+        path = os.path.join(seed_dir, seed_file_name(spec))
+        with open(path, 'w') as f:
+            f.write(compile_table(spec, snapshot[spec['table']]))
+        MigrationLogger.success(f"Wrote {len(snapshot[spec['table']])} rows to {os.path.relpath(path, args.output)}")
+    
+    index_path = os.path.join(args.output, '002_seed_data.sql')
+    with open(index_path, 'w') as f:
+        f.write(compile_index(args.snapshot, snapshot, seed_dir_name))
+    MigrationLogger.success(f"Wrote {index_path}")
+
+
+if __name__ == '__main__':
+    main()
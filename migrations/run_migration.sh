@@ -53,7 +53,7 @@ echo "Starting migration..."
 echo ""
 
 # Run migration
-python3 migrate_supabase_to_aurora.py
+python3 migrate_supabase_to_aurora.py "$@"
 
 echo ""
 echo "=========================================="
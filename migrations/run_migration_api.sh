@@ -46,7 +46,7 @@ echo "Starting migration..."
 echo ""
 
 # Run migration
-python3 migrate_via_api.py
+python3 migrate_via_api.py "$@"
 
 echo ""
 echo "=========================================="